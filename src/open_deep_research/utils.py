@@ -123,6 +123,8 @@ async def summarize_webpage(model: BaseChatModel, webpage_content: str) -> str:
 ##########################
 # MCP Utils
 ##########################
+MCP_TOKEN_REFRESH_BUFFER_SECONDS = 60  # Refresh tokens slightly before they expire so in-flight tool calls don't fail
+
 async def get_mcp_access_token(
     supabase_token: str,
     base_mcp_url: str,
@@ -165,7 +167,7 @@ async def get_tokens(config: RunnableConfig):
     expires_in = tokens.value.get("expires_in")  # seconds until expiration
     created_at = tokens.created_at  # datetime of token creation
     current_time = datetime.now(timezone.utc)
-    expiration_time = created_at + timedelta(seconds=expires_in)
+    expiration_time = created_at + timedelta(seconds=expires_in - MCP_TOKEN_REFRESH_BUFFER_SECONDS)
     if current_time > expiration_time:
         await store.adelete((user_id, "tokens"), "data")
         return None
@@ -194,6 +196,8 @@ async def fetch_tokens(config: RunnableConfig) -> dict[str, Any]:
     if not mcp_config or not mcp_config.get("url"):
         return None
     mcp_tokens = await get_mcp_access_token(supabase_token, mcp_config.get("url"))
+    if not mcp_tokens:
+        return None
 
     await set_tokens(config, mcp_tokens)
     return mcp_tokens
@@ -259,13 +263,14 @@ async def load_mcp_tools(
     except Exception as e:
         print(f"Error loading MCP tools: {e}")
         return []
+    allowed_tool_names = frozenset(configurable.mcp_config.tools)
     for tool in mcp_tools:
         if tool.name in existing_tool_names:
             warnings.warn(
                 f"Trying to add MCP tool with a name {tool.name} that is already in use - this tool will be ignored."
             )
             continue
-        if tool.name not in set(configurable.mcp_config.tools):
+        if tool.name not in allowed_tool_names:
             continue
         tools.append(wrap_mcp_authenticate_tool(tool))
     return tools